@@ -2,6 +2,8 @@
 
 """A module for the 1D spectral extraction binning method"""
 
+from functools import lru_cache
+
 import astropy.units as q
 import numpy as np
 from hotsoss import utils
@@ -10,6 +12,24 @@ from hotsoss import locate_trace as lt
 from .utilities import combine_spectra
 
 
+@lru_cache(maxsize=1)
+def _trace_center_wavelengths():
+    """
+    Compute the wavelength at the center of the trace in each column
+    for orders 1, 2, and 3 once and reuse it for every extraction
+
+    Returns
+    -------
+    tuple
+        The read-only wavelength arrays for each order
+    """
+    wavelengths = lt.trace_wavelengths(order=None, wavecal_file=None, npix=10, subarray='SUBSTRIP256')
+    for wavelength in wavelengths:
+        wavelength.setflags(write=False)
+
+    return tuple(wavelengths)
+
+
 def extract(data, filt, pixel_masks=None, subarray='SUBSTRIP256', units=q.erg/q.s/q.cm**2/q.AA, **kwargs):
     """
     Extract the time-series 1D spectra from a data cube
@@ -36,7 +56,7 @@ def extract(data, filt, pixel_masks=None, subarray='SUBSTRIP256', units=q.erg/q.
     results = {}
 
     # Load the wavebins
-    wavelengths = lt.trace_wavelengths(order=None, wavecal_file=None, npix=10, subarray='SUBSTRIP256')
+    wavelengths = _trace_center_wavelengths()
     wavebins = lt.wavelength_bins(subarray=subarray)
 
     # Get number of frames
@@ -44,7 +64,7 @@ def extract(data, filt, pixel_masks=None, subarray='SUBSTRIP256', units=q.erg/q.
 
     # Load the pixel masks
     if pixel_masks is None:
-        pixel_masks = np.ones((2, data.shape[-2], data.shape[-1]))
+        pixel_masks = np.ones((2, data.shape[-2], data.shape[-1]), dtype=np.uint8)
 
     # Extract each order
     for n, (wavelength, wavebin, mask) in enumerate(zip(wavelengths, wavebins, pixel_masks)):
@@ -98,7 +118,8 @@ def bin_counts(data, wavebins, pixel_mask=None):
     wavebins: sequence
         A list of lists of the pixels in each wavelength bin
     pixel_mask: array-like (optional)
-        A 2D mask of 1s and 0s to apply to the data
+        A 2D mask of 1s and 0s to apply to the data, where pixels
+        marked 0 are excluded from the bins
 
     Returns
     -------
@@ -112,12 +133,30 @@ def bin_counts(data, wavebins, pixel_mask=None):
     # Array to store counts
     counts = np.zeros((data.shape[0], len(wavebins)), dtype=float)
 
-    # Apply the pixel mask by multiplying non-signal pixels by 0 before adding
-    if isinstance(pixel_mask, np.ndarray) and pixel_mask.shape == data.shape[1:]:
-        data *= pixel_mask[None, :, :]
+    # Label every binned pixel with its flattened index and bin number
+    sizes = [len(xpix) for xpix, ypix in wavebins]
+    if sum(sizes) == 0:
+        return counts
+    pixels = np.concatenate([np.ravel_multi_index((np.asarray(xpix, dtype=int), np.asarray(ypix, dtype=int)), data.shape[1:]) for xpix, ypix in wavebins])
+    bins = np.repeat(np.arange(len(wavebins)), sizes)
 
-    # Add up the counts in each bin in each frame
-    for n, (xpix, ypix) in enumerate(wavebins):
-        counts[:, n] = np.nansum(data[:, xpix, ypix], axis=1)
+    # Apply the pixel mask by dropping non-signal pixels before adding
+    if isinstance(pixel_mask, np.ndarray) and pixel_mask.shape == data.shape[1:]:
+        if not np.all((pixel_mask == 0) | (pixel_mask == 1)):
+            raise ValueError("pixel_mask must only contain 1s and 0s")
+        signal = pixel_mask.ravel()[pixels].astype(bool)
+        pixels = pixels[signal]
+        bins = bins[signal]
+
+    # Sort by pixel so each frame is read in memory order
+    order = np.argsort(pixels, kind='stable')
+    pixels = pixels[order]
+    bins = bins[order]
+
+    # Add up the counts in each bin in each frame in a single pass
+    for n, frame in enumerate(data.reshape((data.shape[0], -1))):
+        values = frame[pixels]
+        values[np.isnan(values)] = 0
+        counts[n] = np.bincount(bins, weights=values, minlength=len(wavebins))
 
     return counts
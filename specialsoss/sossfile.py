@@ -5,7 +5,6 @@
 from copy import copy
 from datetime import datetime, timedelta
 import os
-from pkg_resources import resource_filename
 
 from astropy.io import fits
 from astropy.time import Time
@@ -14,6 +13,8 @@ from hotsoss import plotting as plt
 from hotsoss import utils
 import numpy as np
 
+from .utilities import _FILES
+
 
 class SossFile:
     """
@@ -58,7 +59,7 @@ class SossFile:
         """
         # Get config directory
         if configdir is None:
-            configdir = resource_filename('specialsoss', 'files')
+            configdir = _FILES
 
         # Get output directory
         if outdir is None:
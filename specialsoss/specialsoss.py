@@ -2,11 +2,11 @@
 
 """A module to perform optimal spectral extraction of SOSS time series observations"""
 
-from functools import wraps
+from functools import lru_cache, wraps
 import os
-from pkg_resources import resource_filename
 
 from bokeh.plotting import show
+import hotsoss
 from hotsoss import plotting as plt
 from hotsoss import utils
 from hotsoss import locate_trace as lt
@@ -16,6 +16,37 @@ from . import decontaminate as dec
 from . import summation as sm
 from . import binning as bn
 from . import sossfile as sf
+from .utilities import _FILES
+
+# The hotsoss data directory with the order throughputs
+_HOTSOSS_FILES = os.path.join(os.path.dirname(hotsoss.__file__), 'files')
+
+
+@lru_cache(maxsize=3)
+def _order_throughput(order):
+    """
+    Load the GR700XD throughput for the given order, which is
+    read from file once and shared by all exposures
+
+    Parameters
+    ----------
+    order: int
+        The trace order, [1, 2, 3]
+
+    Returns
+    -------
+    np.ndarray
+        The read-only [wavelength, throughput] of the order or None if no file
+    """
+    file = os.path.join(_HOTSOSS_FILES, 'GR700XD_{}.txt'.format(order))
+    if not os.path.isfile(file):
+        return None
+
+    # Load the table and protect the cached copy
+    throughput = np.genfromtxt(file, unpack=True)
+    throughput.setflags(write=False)
+
+    return throughput
 
 
 def results_required(func):
@@ -81,12 +112,25 @@ class SossExposure(object):
         if self.uncal.file is not None:
             print("Looks like you have initialized an 'uncal' file! To pipeline process it, run 'SossExposure.uncal.calibrate()' method.")
 
-    def calculate_order_masks(self):
+    def calculate_order_masks(self, n_jobs=None, **kwargs):
         """
         Calculate the order masks from the median image
+
+        Parameters
+        ----------
+        n_jobs: int (optional)
+            The number of workers to fit the 2048 columns with,
+            defaulting to the hotsoss.locate_trace.order_masks value
+        **kwargs
+            Keyword arguments passed through hotsoss.locate_trace.order_masks
+            to hotsoss.locate_trace.isolate_signal for each column fit
         """
+        # Only override the hotsoss worker count if one is given
+        if n_jobs is not None:
+            kwargs['n_jobs'] = n_jobs
+
         # Find the trace in all columns
-        self.order_masks = lt.order_masks(self.median, save=True)
+        self.order_masks = lt.order_masks(self.median, save=True, **kwargs)
 
         print("New order masks calculated from median image.")
 
@@ -283,6 +327,33 @@ class SossExposure(object):
 
         return settings
 
+    @property
+    def order_masks(self):
+        """Return the order 1 and 2 masks"""
+        return self._order_masks
+
+    @order_masks.setter
+    def order_masks(self, masks):
+        """
+        Setter for the order_masks attribute
+
+        Parameters
+        ----------
+        masks: sequence
+            The 2D masks of 1s and 0s for orders 1 and 2
+        """
+        if masks is not None:
+
+            # Make sure casting won't change the masks
+            masks = np.asarray(masks)
+            if not np.all((masks == 0) | (masks == 1)):
+                raise ValueError("order_masks must only contain 1s and 0s")
+
+            # Store the masks as bytes rather than floats
+            masks = masks.astype(np.uint8)
+
+        self._order_masks = masks
+
     def load_file(self, filepath, **kwargs):
         """
         Load the data and headers from an observation file
@@ -328,9 +399,9 @@ class SossExposure(object):
 
         # Pull out the throughput for the appropriate order
         for ord in [1, 2, 3]:
-            file = resource_filename('hotsoss', 'files/GR700XD_{}.txt'.format(ord))
-            if os.path.isfile(file):
-                self.filters.append(np.genfromtxt(file, unpack=True))
+            throughput = _order_throughput(ord)
+            if throughput is not None:
+                self.filters.append(throughput)
 
     def plot_frames(self, ext='uncal', scale='linear', draw=True, **kwargs):
         """
@@ -422,7 +493,7 @@ class SimExposure(SossExposure):
             The desired level of pipeline processing, ['uncal', 'ramp']
         """
         # Get the file
-        file = resource_filename('specialsoss', 'files/{}_{}_{}.fits'.format(subarray, filt, level))
+        file = os.path.join(_FILES, '{}_{}_{}.fits'.format(subarray, filt, level))
 
         # Inherit from SossObs
         super().__init__(file, name='Simulated Observation', **kwargs)
@@ -3,10 +3,12 @@
 """A module of shared tools for SOSS data"""
 
 import os
-from pkg_resources import resource_filename
 
 import numpy as np
 
+# The specialsoss package data directory
+_FILES = os.path.join(os.path.dirname(__file__), 'files')
+
 
 def combine_spectra(s1, s2):
     """
@@ -105,7 +107,7 @@ def test_simulations():
         from awesimsoss import BlackbodyTSO
 
         # Save location
-        path = resource_filename('specialsoss', 'files/')
+        path = _FILES
 
         # Delete old files
         os.system('rm {}/*.fits'.format(path))
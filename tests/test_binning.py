@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `binning` module."""
+
+import unittest
+
+import numpy as np
+
+from specialsoss import binning as bn
+
+
+class TestBinCounts(unittest.TestCase):
+    """Test bin_counts function"""
+    def setUp(self):
+        """Test instance setup"""
+        # Make some data and wavelength bins for testing
+        self.data = np.random.normal(loc=100, size=(2, 2, 256, 2048))
+        self.data[0, 0, 10, 10] = np.nan
+        wave_map = np.tile(np.linspace(2.8, 0.6, 2048), (256, 1))
+        edges = np.linspace(0.5, 3, 1000)
+        self.wavebins = [np.where((wave_map >= w0) & (wave_map < w1)) for w0, w1 in zip(edges[:-1], edges[1:])]
+
+    def test_bin_counts(self):
+        """Test that the counts match a bin by bin sum"""
+        # Run function
+        counts = bn.bin_counts(self.data.copy(), self.wavebins)
+
+        # Check the result against nansum over each bin
+        frames = self.data.reshape(4, 256, 2048)
+        expected = np.array([np.nansum(frames[:, xpix, ypix], axis=1) for xpix, ypix in self.wavebins]).T
+        self.assertEqual(counts.shape, (4, len(self.wavebins)))
+        self.assertTrue(np.allclose(counts, expected))
+
+    def test_empty_bins(self):
+        """Test that empty bins have zero counts"""
+        empty = (np.array([], dtype=int), np.array([], dtype=int))
+        counts = bn.bin_counts(self.data.copy(), [empty] + self.wavebins[:5] + [empty])
+        self.assertTrue(np.all(counts[:, 0] == 0))
+        self.assertTrue(np.all(counts[:, -1] == 0))
+
+    def test_pixel_mask(self):
+        """Test that masked pixels are not counted"""
+        # Mask out the bottom half of the frame
+        mask = np.ones((256, 2048), dtype=np.uint8)
+        mask[128:] = 0
+        data = self.data.copy()
+        counts = bn.bin_counts(data, self.wavebins, pixel_mask=mask)
+
+        # Check the result against nansum over the top half of each bin
+        frames = self.data.reshape(4, 256, 2048)
+        expected = np.array([np.nansum(frames[:, xpix[xpix < 128], ypix[xpix < 128]], axis=1) for xpix, ypix in self.wavebins]).T
+        self.assertTrue(np.allclose(counts, expected))
+
+        # Make sure the input data is untouched
+        np.testing.assert_array_equal(data, self.data)
+
+        # Fail if the mask is not binary
+        self.assertRaises(ValueError, bn.bin_counts, data, self.wavebins, pixel_mask=mask*0.5)
+
+
+class TestTraceCenterWavelengths(unittest.TestCase):
+    """Test _trace_center_wavelengths function"""
+    def test_cached(self):
+        """Test that the wavelengths are computed once and read-only"""
+        wavelengths = bn._trace_center_wavelengths()
+        self.assertIs(wavelengths, bn._trace_center_wavelengths())
+
+        # Check the arrays for orders 1, 2, and 3
+        self.assertEqual(len(wavelengths), 3)
+        for wavelength in wavelengths:
+            self.assertEqual(wavelength.shape, (2048,))
+            self.assertFalse(wavelength.flags.writeable)
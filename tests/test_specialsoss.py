@@ -6,6 +6,8 @@
 import unittest
 from pkg_resources import resource_filename
 
+import numpy as np
+
 from specialsoss import specialsoss
 
 
@@ -32,6 +34,10 @@ class TestSossExposure(unittest.TestCase):
         self.assertEqual(obs.nrows, 256)
         self.assertEqual(obs.ncols, 2048)
 
+        # Check the order masks
+        self.assertEqual(obs.order_masks.shape, (2, 256, 2048))
+        self.assertEqual(obs.order_masks.dtype, np.uint8)
+
     def test_calibrate(self):
         """Test calibrate method"""
         obs = specialsoss.SossExposure(self.uncal)
@@ -52,6 +58,29 @@ class TestSossExposure(unittest.TestCase):
         obs = specialsoss.SossExposure(self.uncal)
         obs.info
 
+    def test_order_masks(self):
+        """Test the order_masks setter"""
+        obs = specialsoss.SossExposure(self.uncal)
+
+        # Binary masks are stored as bytes
+        obs.order_masks = np.ones((2, 256, 2048))
+        self.assertEqual(obs.order_masks.dtype, np.uint8)
+
+        # Fail if the masks are not binary
+        self.assertRaises(ValueError, setattr, obs, 'order_masks', np.ones((2, 256, 2048))*0.5)
+        masks = np.ones((2, 256, 2048))
+        masks[0, 0, 0] = np.nan
+        self.assertRaises(ValueError, setattr, obs, 'order_masks', masks)
+
+    def test_load_filters(self):
+        """Test the throughputs are loaded once and shared"""
+        obs1 = specialsoss.SossExposure(self.uncal)
+        obs2 = specialsoss.SossExposure(self.uncal)
+        self.assertEqual(len(obs1.filters), len(obs2.filters))
+        for filt1, filt2 in zip(obs1.filters, obs2.filters):
+            self.assertIs(filt1, filt2)
+            self.assertFalse(filt1.flags.writeable)
+
     def test_wavecal(self):
         """Test loading wavecal file"""
         obs = specialsoss.SossExposure(self.uncal)
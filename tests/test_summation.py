@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `summation` module."""
+
+import os
+import time
+import unittest
+
+import numpy as np
+
+from specialsoss import summation as sm
+
+# Reference extraction times [s] for a 2x2 integration cube of each subarray
+EXTRACT_TIMES = {'SUBSTRIP96': 0.025, 'SUBSTRIP256': 0.04, 'FULL': 0.2}
+
+# Opt in to the timing test by scaling the reference times for the machine,
+# e.g. SPECIALSOSS_PERF_SCALE=1 on a dedicated box or 3 on a slower one
+PERF_SCALE = os.environ.get('SPECIALSOSS_PERF_SCALE')
+
+
+class TestExtract(unittest.TestCase):
+    """Test extract function"""
+    @classmethod
+    def setUpClass(cls):
+        """Test class setup"""
+        # Make 4D data for each subarray once, as the FULL frame cube is large
+        subarrays = {'SUBSTRIP96': 96, 'SUBSTRIP256': 256, 'FULL': 2048}
+        cls.tso4d = {subarray: np.ones((2, 2, nrows, 2048)) for subarray, nrows in subarrays.items()}
+        cls.filters = ['CLEAR', 'F277W']
+
+    def test_extract(self):
+        """Test that the data can be extracted"""
+        for filt in self.filters:
+            for subarray, data in self.tso4d.items():
+                with self.subTest(filt=filt, subarray=subarray):
+
+                    # Run the extraction
+                    results = sm.extract(data, filt=filt, subarray=subarray)['final']
+
+                    # Check the results
+                    self.assertEqual(results['wavelength'].shape, (2040,))
+                    self.assertEqual(results['counts'].shape, (4, 2040))
+                    self.assertEqual(results['flux'].shape, (4, 2040))
+                    self.assertEqual(results['filter'], filt)
+                    self.assertEqual(results['subarray'], subarray)
+
+    @unittest.skipUnless(PERF_SCALE, "Set SPECIALSOSS_PERF_SCALE to run the timing test")
+    def test_extract_perf(self):
+        """Test that the extraction is no more than 2x slower than the reference time"""
+        for filt in self.filters:
+            for subarray, data in self.tso4d.items():
+                with self.subTest(filt=filt, subarray=subarray):
+
+                    # Warm up file caches, then take the best of a few runs
+                    sm.extract(data, filt=filt, subarray=subarray)
+                    times = []
+                    for _ in range(3):
+                        start = time.perf_counter()
+                        sm.extract(data, filt=filt, subarray=subarray)
+                        times.append(time.perf_counter() - start)
+
+                    # Check for a regression
+                    self.assertLess(min(times), 2 * EXTRACT_TIMES[subarray] * float(PERF_SCALE))